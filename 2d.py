@@ -1,9 +1,14 @@
+import copy
+import numbers
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
 from PIL import Image
 
+
 class NFLPlayAnimator:
+    # Field traces never change, so they are built once and shared by all instances
+    _field_elements_cache = None
+
     def __init__(self):
         self.colors = {
             'ARI': "#97233F", 'ATL': "#A71930", 'BAL': '#241773', 'BUF': "#00338D",
@@ -45,6 +50,14 @@ class NFLPlayAnimator:
 
 
     def create_field_markers(self):
+        """Return the field traces, building them on first use and caching them as plain dicts"""
+        if NFLPlayAnimator._field_elements_cache is None:
+            NFLPlayAnimator._field_elements_cache = tuple(
+                trace.to_plotly_json() for trace in self._build_field_markers()
+            )
+        return copy.deepcopy(list(NFLPlayAnimator._field_elements_cache))
+
+    def _build_field_markers(self):
         """Create the football field with endzones and yard lines using 2D shapes"""
         field_elements = []
         
@@ -88,45 +101,33 @@ class NFLPlayAnimator:
             )
         )
         
-        # Add yard lines
-        for yard in range(10, 111, 5):
-            field_elements.append(
-                go.Scatter(
-                    x=[yard, yard],
-                    y=[0, 53.3],
-                    mode='lines',
-                    line=dict(color='rgba(255, 255, 255, 0.30)', width=2),
-                    showlegend=False,
-                    hoverinfo='none'
-                )
+        # Add yard lines as one trace, with NaN breaks between segments
+        x, y = self._create_line_segments(np.arange(10, 111, 5), 0, 53.3)
+        field_elements.append(
+            go.Scatter(
+                x=x,
+                y=y,
+                mode='lines',
+                line=dict(color='rgba(255, 255, 255, 0.30)', width=2),
+                showlegend=False,
+                hoverinfo='none'
             )
+        )
         
         # Add hash marks
-        # Lower hash marks
-        for yard in range(10, 111):
-            field_elements.append(
-                go.Scatter(
-                    x=[yard, yard],
-                    y=[22.5, 23.5],
-                    mode='lines',
-                    line=dict(color='rgba(255, 255, 255, 0.25)', width=0.75),
-                    showlegend=False,
-                    hoverinfo='none'
-                )
-            )
-        
-        # Upper hash marks
-        for yard in range(10, 111):
-            field_elements.append(
-                go.Scatter(
-                    x=[yard, yard],
-                    y=[29.8, 30.8],
-                    mode='lines',
-                    line=dict(color='rgba(255, 255, 255, 0.25)', width=0.75),
-                    showlegend=False,
-                    hoverinfo='none'
-                )
+        yards = np.arange(10, 111)
+        lower_x, lower_y = self._create_line_segments(yards, 22.5, 23.5)
+        upper_x, upper_y = self._create_line_segments(yards, 29.8, 30.8)
+        field_elements.append(
+            go.Scatter(
+                x=np.concatenate([lower_x, upper_x]),
+                y=np.concatenate([lower_y, upper_y]),
+                mode='lines',
+                line=dict(color='rgba(255, 255, 255, 0.25)', width=0.75),
+                showlegend=False,
+                hoverinfo='none'
             )
+        )
         
         # Add sidelines and endlines
         field_elements.append(
@@ -141,10 +142,38 @@ class NFLPlayAnimator:
         )
         
         return field_elements
-    def animate_play(self, tracking_df, play_df):
+
+    def _create_line_segments(self, x, y_min, y_max):
+        """Vertical segments at each x, joined into a single path with NaN breaks"""
+        xs = np.empty(3 * len(x))
+        ys = np.empty(3 * len(x))
+        xs[0::3] = x
+        xs[1::3] = x
+        xs[2::3] = np.nan
+        ys[0::3] = y_min
+        ys[1::3] = y_max
+        ys[2::3] = np.nan
+        
+        return xs, ys
+
+    def create_hover_text(self, player_df):
+        """Build the hover text for every player row in one vectorized pass"""
+        # Name and jersey are fixed for the whole play, so format them once per player
+        players = player_df.drop_duplicates('nflId').set_index('nflId')
+        prefix = "Name: " + players.displayName + "<br>Jersey: " + players.jerseyNumber.astype(str)
+        return (
+            player_df.nflId.map(prefix) +
+            "<br>Speed: " + np.char.mod('%.1f', player_df.s.values) + " mph" +
+            "<br>Direction: " + np.char.mod('%.1f', player_df.dir.values) + "°"
+        )
+
+    def animate_play(self, tracking_df, play_df, frame_stride=1):
         """
         Create an animated visualization of an NFL play with field background.
+        Use frame_stride > 1 to keep only every n-th tracking frame on long plays.
         """
+        if not isinstance(frame_stride, numbers.Integral) or frame_stride < 1:
+            raise ValueError(f"frame_stride must be a positive integer, got {frame_stride!r}")
         gameId = tracking_df.gameId.iloc[0]
         playId = tracking_df.playId.iloc[0]
 
@@ -158,105 +187,124 @@ class NFLPlayAnimator:
         playDescription = play_info.playDescription
 
         # Split long play descriptions
-        if len(playDescription.split()) > 15 and len(playDescription) > 115:
-            playDescription = " ".join(playDescription.split()[:16]) + \
-                "<br>" + " ".join(playDescription.split()[16:])
+        words = playDescription.split()
+        if len(words) > 15 and len(playDescription) > 115:
+            playDescription = " ".join(words[:16]) + "<br>" + " ".join(words[16:])
 
         updatemenus_dict, sliders_dict = self.create_animation_controls()
         frames = []
         
-        # Get field elements once - they'll be the same for all frames
+        # Field elements are static - they go into the base figure once and
+        # frames only update the player/football traces that follow them
         field_elements = self.create_field_markers()
         
-        # Create frames for each tracking moment
-        for frameId in sorted(tracking_df.frameId.unique()):
-            # Start with field elements for each frame
-            data = field_elements.copy()
-            
-            # Add line of scrimmage and first down lines
-            for line_x, color in [(line_of_scrimmage, 'rgba(135, 206, 235, 0.4)'),  # Light blue for LOS
-                                (first_down_marker, 'rgba(255, 255, 0, 0.8)')]:
-                data.append(
-                    go.Scatter(
-                        x=[line_x, line_x],
-                        y=[0, 53.3],
-                        line_dash='dash',
-                        line_color=color,
-                        line_width=2,
-                        showlegend=False,
-                        hoverinfo='none'
-                    )
+        # Add line of scrimmage and first down lines
+        for line_x, color in [(line_of_scrimmage, 'rgba(135, 206, 235, 0.4)'),  # Light blue for LOS
+                            (first_down_marker, 'rgba(255, 255, 0, 0.8)')]:
+            field_elements.append(
+                go.Scatter(
+                    x=[line_x, line_x],
+                    y=[0, 53.3],
+                    line_dash='dash',
+                    line_color=color,
+                    line_width=2,
+                    showlegend=False,
+                    hoverinfo='none'
                 )
+            )
 
-            # Plot players
-            frame_data = tracking_df[tracking_df.frameId == frameId]
+        # Coordinates never need more than the tracking data's 2 decimals. Rounding
+        # in float64 keeps the serialized numbers short with any JSON engine
+        tracking_df = tracking_df.round({'x': 2, 'y': 2})
+
+        # Frame ids in play order; frames themselves come from the groupby dicts below
+        unique_frames = np.sort(tracking_df.frameId.unique())[::frame_stride]
+        if frame_stride > 1:
+            tracking_df = tracking_df[tracking_df.frameId.isin(unique_frames)]
+
+        # One set of step options shared by every slider step. Each kept frame
+        # spans frame_stride tracking frames, so playback stays at real speed.
+        # WebGL traces only update on redraw, so frames are redrawn
+        anim_opts = {"frame": {"duration": 100 * frame_stride, "redraw": True},
+                     "mode": "immediate",
+                     "transition": {"duration": 0}}
+        sliders_dict["steps"] = [
+            {"args": [[str(frameId)], anim_opts], "label": str(frameId), "method": "animate"}
+            for frameId in unique_frames
+        ]
+
+        # Split players from the football once with vectorized masks, so
+        # nothing downstream needs to check for missing clubs or names
+        football_mask = tracking_df.nflId.isna()
+        football_df = tracking_df[football_mask]
+        player_df = tracking_df[~football_mask & tracking_df.club.notna() & tracking_df.displayName.notna()]
+        player_df = player_df.assign(hover_text=self.create_hover_text(player_df))
+
+        # Every frame carries one trace per club plus the football, so the
+        # dynamic trace indices stay the same across frames
+        clubs = player_df.club.unique()
+        dynamic_traces = list(range(len(field_elements), len(field_elements) + len(clubs) + 1))
+
+        # Split the tracking data in a single pass instead of masking per frame
+        club_groups = dict(iter(player_df.groupby(['frameId', 'club'], sort=False)))
+        football_by_frame = dict(iter(football_df.groupby('frameId', sort=False)))
+
+        # Styling lives on the base traces; frames only restyle positions and hover text
+        trace_styles = []
+        for club in clubs:
+            trace_styles.append({
+                "type": "scattergl",
+                "mode": "markers",
+                "marker": {
+                    "color": self.colors.get(club, "#000000"),
+                    "size": 12,
+                    "line": {"color": "white", "width": 0.5}
+                },
+                "name": club,
+                "hoverinfo": "text"
+            })
+        trace_styles.append({
+            "type": "scattergl",
+            "mode": "markers",
+            "marker": {
+                "color": self.colors['football'],
+                "size": 8,
+                "symbol": "diamond",
+                "line": {"color": "white", "width": 0.5}
+            },
+            "name": "football",
+            "hoverinfo": "none"
+        })
+        
+        # Create frames for each tracking moment
+        for frameId in unique_frames:
+            data = []
         
             # Handle players
-            for club in frame_data.club.unique():
-                if pd.isna(club):
-                    continue
-                    
-                club_data = frame_data[(frame_data.club == club) & (frame_data.displayName != 'football')]  # Added condition to exclude football
-                hover_text = []
-                for _, player in club_data.iterrows():
-                    if pd.isna(player.displayName):
-                        continue
-                    hover_text.append(
-                        f"Name: {player.displayName}<br>"
-                        f"Jersey: {player.jerseyNumber}<br>"
-                        f"Speed: {player.s:.1f} mph<br>"
-                        f"Direction: {player.dir:.1f}°"
-                    )
-                
-                data.append(
-                    go.Scatter(
-                        x=club_data["x"],
-                        y=club_data["y"],
-                        mode='markers',
-                        marker=dict(
-                            color=self.colors.get(club, "#000000"),
-                            size=12,
-                            line=dict(color='white', width=0.5)
-                        ),
-                        name=club,
-                        hovertext=hover_text,
-                        hoverinfo="text"
-                    )
-                )
-                # Handle football separately
-            football_data = frame_data[frame_data.nflId.isna()]
-            if not football_data.empty:
-                data.append(
-                    go.Scatter(
-                        x=football_data["x"],
-                        y=football_data["y"],
-                        mode='markers',
-                        marker=dict(
-                            color=self.colors['football'],
-                            size=8,
-                            symbol='diamond',
-                            line=dict(color='white', width=0.5)
-                        ),
-                        name='football',
-                        hoverinfo='none'
-                    )
-                )
+            for club in clubs:
+                club_data = club_groups.get((frameId, club), player_df.iloc[:0])
+                data.append({
+                    "type": "scattergl",
+                    "x": club_data["x"].values,
+                    "y": club_data["y"].values,
+                    "hovertext": club_data["hover_text"].values
+                })
             
-            sliders_dict["steps"].append({
-                "args": [
-                    [frameId],
-                    {"frame": {"duration": 100, "redraw": False},
-                    "mode": "immediate",
-                    "transition": {"duration": 0}}
-                ],
-                "label": str(frameId),
-                "method": "animate"
+            # Handle football separately
+            football_data = football_by_frame.get(frameId, football_df.iloc[:0])
+            data.append({
+                "type": "scattergl",
+                "x": football_data["x"].values,
+                "y": football_data["y"].values
             })
             
-            frames.append(go.Frame(data=data, name=str(frameId)))
+            if not frames:
+                initial_data = data
+            
+            frames.append(go.Frame(data=data, traces=dynamic_traces, name=str(frameId)))
 
         # Set up the layout (rest of the code remains the same)
-        layout = go.Layout(
+        layout = dict(
             autosize=False,
             width=900,
             height=450,
@@ -294,12 +342,10 @@ class NFLPlayAnimator:
             dragmode=False
         )
 
-        # Create figure with field elements in initial data
-        fig = go.Figure(
-            data=frames[0]["data"],  # This now includes field elements
-            layout=layout,
-            frames=frames[1:]
-        )
+        # Create figure with static field elements followed by the first frame
+        fig = go.Figure(layout=layout, frames=frames)
+        fig.add_traces(field_elements)
+        fig.add_traces([{**style, **trace} for style, trace in zip(trace_styles, initial_data)])
 
         # Add down markers with improved visibility
         for y_val in [0, 53]:
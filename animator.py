@@ -1,10 +1,44 @@
+import copy
+import numbers
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 from PIL import Image
 from typing import Union, Tuple, Dict, List
 
+
+def _compute_z(frame_ids, is_football, start_x, start_y, end_x, end_y,
+               pass_forward_frame, pass_arrived_frame, gravity):
+    """Projectile heights and flight metrics for the football between throw and arrival"""
+    # Calculate distance and velocities
+    distance = np.sqrt((start_x - end_x)**2 + (start_y - end_y)**2)
+    time_of_flight = (pass_arrived_frame - pass_forward_frame) / 10
+    vxy = distance / time_of_flight
+    
+    # Calculate vertical velocities
+    vz = (time_of_flight * gravity) / 2
+    vz1 = (0.5 + 0.5 * gravity * time_of_flight**2) / time_of_flight
+    vz2 = (-0.5 + 0.5 * gravity * time_of_flight**2) / time_of_flight
+    
+    # Calculate initial velocity and launch angle
+    v_0 = np.sqrt(vz**2 + vxy**2)
+    launch_angle = np.degrees(np.arctan(vz / vxy))
+    
+    # Base height calculations, sharing the gravity term across all three
+    in_flight = is_football & (frame_ids >= pass_forward_frame) & (frame_ids <= pass_arrived_frame)
+    t = (frame_ids - pass_forward_frame) / 10
+    half_gt2 = 0.5 * gravity * t * t
+    z = np.where(in_flight, 2 + vz * t - half_gt2, 0.0)
+    z1 = np.where(in_flight, 1.5 + vz1 * t - half_gt2, 0.0)
+    z2 = np.where(in_flight, 2.5 + vz2 * t - half_gt2, 0.0)
+    
+    return z, z1, z2, (distance, time_of_flight, vxy, vz, v_0, launch_angle)
+
+
 class NFLPlayAnimator:
+    # Field surfaces never change, so they are built once and shared by all instances
+    _field_surface_cache = None
+
     def __init__(self):
         self.colors = {
             'ARI': "#97233F", 'ATL': "#A71930", 'BAL': '#241773', 'BUF': "#00338D",
@@ -25,22 +59,24 @@ class NFLPlayAnimator:
         df = tracking_df.copy()
         
         # Get football-only data
-        football_data = df[df['displayName'] == 'football'].copy()
-        player_data = df[df['displayName'] != 'football'].copy()
+        football_data = df[df['displayName'] == 'football']
+        
+        # First frame of every event, found in a single grouped pass
+        event_min = football_data.groupby('event', sort=False)['frameId'].min()
         
         # Find pass_forward frame
-        pass_forward_frame = football_data[football_data['event'] == 'pass_forward']['frameId'].min()
+        pass_forward_frame = event_min.get('pass_forward', np.nan)
         
         # Find pass_arrived frame (look for any pass outcome event)
         arrival_events = ['pass_arrived', 'pass_outcome_interception', 
                          'pass_outcome_touchdown', 'pass_outcome_caught', 
                          'pass_outcome_incomplete']
-        pass_arrived_frame = football_data[football_data['event'].isin(arrival_events)]['frameId'].min()
+        pass_arrived_frame = event_min[event_min.index.isin(arrival_events)].min()
         
         if pd.isna(pass_forward_frame) or pd.isna(pass_arrived_frame):
             # If we can't find the exact frames, estimate them
             all_frames = sorted(football_data['frameId'].unique())
-            snap_frame = football_data[football_data['event'] == 'ball_snap']['frameId'].min()
+            snap_frame = event_min.get('ball_snap', np.nan)
             
             if pd.isna(snap_frame):
                 snap_frame = all_frames[0]
@@ -64,50 +100,22 @@ class NFLPlayAnimator:
         # Calculate time since throw for all frames
         df['seconds_since_throw'] = (df['frameId'] - pass_forward_frame) / 10
         
-        # Initialize z-coordinates
-        df['z'] = 0
-        df['z1'] = 0
-        df['z2'] = 0
-        
         # Get start and end positions
         start_pos = football_data[football_data['frameId'] == pass_forward_frame].iloc[0]
         end_pos = football_data[football_data['frameId'] == pass_arrived_frame].iloc[0]
         
-        # Calculate distance and velocities
-        distance = np.sqrt((start_pos['x'] - end_pos['x'])**2 + 
-                         (start_pos['y'] - end_pos['y'])**2)
-        
-        time_of_flight = (pass_arrived_frame - pass_forward_frame) / 10
-        vxy = distance / time_of_flight
-        
-        # Calculate vertical velocities
-        vz = (time_of_flight * self.GRAVITY) / 2
-        vz1 = (0.5 + 0.5 * self.GRAVITY * time_of_flight**2) / time_of_flight
-        vz2 = (-0.5 + 0.5 * self.GRAVITY * time_of_flight**2) / time_of_flight
-        
-        # Calculate initial velocity and launch angle
-        v_0 = np.sqrt(vz**2 + vxy**2)
-        launch_angle = np.degrees(np.arctan(vz/vxy))
-        
-        # Calculate z-coordinates for the football
-        football_mask = df['displayName'] == 'football'
-        flight_mask = (df['frameId'] >= pass_forward_frame) & (df['frameId'] <= pass_arrived_frame)
-        
-        # Base height calculations
-        df.loc[football_mask & flight_mask, 'z'] = (
-            2 + vz * df.loc[football_mask & flight_mask, 'seconds_since_throw'] -
-            0.5 * self.GRAVITY * df.loc[football_mask & flight_mask, 'seconds_since_throw']**2
-        )
-        
-        df.loc[football_mask & flight_mask, 'z1'] = (
-            1.5 + vz1 * df.loc[football_mask & flight_mask, 'seconds_since_throw'] -
-            0.5 * self.GRAVITY * df.loc[football_mask & flight_mask, 'seconds_since_throw']**2
-        )
-        
-        df.loc[football_mask & flight_mask, 'z2'] = (
-            2.5 + vz2 * df.loc[football_mask & flight_mask, 'seconds_since_throw'] -
-            0.5 * self.GRAVITY * df.loc[football_mask & flight_mask, 'seconds_since_throw']**2
+        # Run the projectile physics on plain arrays, keeping NumPy scalar semantics
+        z, z1, z2, (distance, time_of_flight, vxy, vz, v_0, launch_angle) = _compute_z(
+            df['frameId'].values.astype(np.float64),
+            df['displayName'].values == 'football',
+            np.float64(start_pos['x']), np.float64(start_pos['y']),
+            np.float64(end_pos['x']), np.float64(end_pos['y']),
+            np.float64(pass_forward_frame), np.float64(pass_arrived_frame),
+            np.float64(self.GRAVITY)
         )
+        df['z'] = z
+        df['z1'] = z1
+        df['z2'] = z2
         
         # Create return dictionary with calculated metrics
         metrics = {
@@ -128,8 +136,11 @@ class NFLPlayAnimator:
         
         return df, metrics
     
-    def animate_play(self, tracking_df: pd.DataFrame, play_df: pd.DataFrame) -> go.Figure:
-        """Create an animated 3D visualization of an NFL play"""
+    def animate_play(self, tracking_df: pd.DataFrame, play_df: pd.DataFrame, frame_stride: int = 1) -> go.Figure:
+        """Create an animated 3D visualization of an NFL play, keeping every frame_stride-th frame"""
+        if not isinstance(frame_stride, numbers.Integral) or frame_stride < 1:
+            raise ValueError(f"frame_stride must be a positive integer, got {frame_stride!r}")
+        
         # Add z-coordinates to tracking data
         tracking_df, play_metrics = self.add_z_coordinates(tracking_df)
         
@@ -139,7 +150,7 @@ class NFLPlayAnimator:
         playId = tracking_df.playId.iloc[0]
         
         # Create animation controls
-        updatemenus_dict, sliders_dict = self.create_animation_controls()
+        updatemenus_dict, sliders_dict = self.create_animation_controls(frame_stride)
         
         # Create base figure with field
         fig = go.Figure()
@@ -149,85 +160,106 @@ class NFLPlayAnimator:
         for surface in field_surfaces:
             fig.add_trace(surface)
             
+        # Coordinates never need more than the tracking data's 2 decimals. Rounding
+        # in float64 keeps the serialized numbers short with any JSON engine
+        tracking_df = tracking_df.round({'x': 2, 'y': 2})
+        
+        # Frame ids in play order; frames themselves come from the groupby dicts below
+        unique_frames = np.sort(tracking_df.frameId.unique())[::frame_stride]
+        if frame_stride > 1:
+            tracking_df = tracking_df[tracking_df['frameId'].isin(unique_frames)]
+
+        # One set of step options shared by every slider step. Each kept frame
+        # spans frame_stride tracking frames, so playback stays at real speed
+        anim_opts = {"frame": {"duration": 100 * frame_stride, "redraw": False},
+                     "mode": "immediate",
+                     "transition": {"duration": 0}}
+        sliders_dict["steps"] = [
+            {"args": [[str(frameId)], anim_opts], "label": str(frameId), "method": "animate"}
+            for frameId in unique_frames
+        ]
+
+        # Split players from the football once with vectorized masks, so
+        # nothing downstream needs to check for missing clubs or names
+        football_mask = tracking_df['nflId'].isna()
+        football_data = tracking_df[football_mask]
+        player_data = tracking_df[
+            ~football_mask & tracking_df['club'].notna() & tracking_df['displayName'].notna()
+        ]
+        player_data = player_data.assign(hover_text=self.create_hover_text(player_data))
+        teams = player_data['club'].unique()
+        
+        # Group the tracking data once instead of masking it for every frame
+        football_by_frame = dict(iter(football_data.groupby('frameId', sort=False)))
+        team_groups = dict(iter(player_data.groupby(['frameId', 'club'], sort=False)))
+        
+        # Styling lives on the base traces; frames only restyle positions and text
+        trace_styles = [{
+            "type": "scatter3d",
+            "mode": "markers",
+            "marker": {
+                "color": self.colors['football'],
+                "size": 6,
+                "symbol": "diamond"
+            },
+            "name": "football",
+            "hoverinfo": "none"
+        }]
+        for team in teams:
+            trace_styles.append({
+                "type": "scatter3d",
+                "mode": "markers+text",
+                "marker": {
+                    "color": self.colors.get(team, "#000000"),
+                    "size": 12,
+                    "line": {"color": "white", "width": 1}
+                },
+                "name": team,
+                "hoverinfo": "text",
+                "textposition": "middle center"
+            })
+        dynamic_traces = list(range(len(field_surfaces), len(field_surfaces) + len(trace_styles)))
+            
         # Create frames for animation
         frames = []
-        for frameId in sorted(tracking_df.frameId.unique()):
-            frame_data = tracking_df[tracking_df.frameId == frameId]
-            
+        for frameId in unique_frames:
             # Create frame traces
             frame_traces = []
             
             # Add football
-            football_data = frame_data[frame_data['displayName'] == 'football']
-            if not football_data.empty:
-                frame_traces.append(
-                    go.Scatter3d(
-                        x=football_data["x"],
-                        y=football_data["y"],
-                        z=football_data["z"],
-                        mode='markers',
-                        marker=dict(
-                            color=self.colors['football'],
-                            size=6,
-                            symbol='diamond'
-                        ),
-                        name='football',
-                        hoverinfo='none'
-                    )
-                )
+            frame_football = football_by_frame.get(frameId, football_data.iloc[:0])
+            frame_traces.append({
+                "type": "scatter3d",
+                "x": frame_football["x"].values,
+                "y": frame_football["y"].values,
+                "z": frame_football["z"].values
+            })
             
             # Add players
-            for team in frame_data.club.unique():
-                if pd.isna(team):
-                    continue
-                    
-                team_data = frame_data[(frame_data.club == team) & (frame_data.displayName != 'football')].copy()
-                team_data['z'] = 1
-                hover_text = [
-                    f"Name: {player.displayName}<br>"
-                    f"Jersey: {player.jerseyNumber}<br>"
-                    f"Speed: {player.s:.1f} mph<br>"
-                    f"Direction: {player.dir:.1f}°"
-                    for _, player in team_data.iterrows() if not pd.isna(player.displayName)
-                ]
-                
-                frame_traces.append(
-                    go.Scatter3d(
-                        x=team_data["x"],
-                        y=team_data["y"],
-                        z=team_data["z"],
-                        mode='markers+text',
-                        text=team_data["jerseyNumber"],
-                        marker=dict(
-                            color=self.colors.get(team, "#000000"),
-                            size=12,
-                            line=dict(color='white', width=1)
-                        ),
-                        name=team,
-                        hovertext=hover_text,
-                        hoverinfo="text",
-                        textposition="middle center"
-                    )
-                )
+            for team in teams:
+                team_data = team_groups.get((frameId, team), player_data.iloc[:0])
+                frame_traces.append({
+                    "type": "scatter3d",
+                    "x": team_data["x"].values,
+                    "y": team_data["y"].values,
+                    "z": np.ones(len(team_data), dtype=np.float32),
+                    "text": team_data["jerseyNumber"].values,
+                    "hovertext": team_data["hover_text"].values
+                })
             
-            # Add frame to slider
-            sliders_dict["steps"].append({
-                "args": [
-                    [frameId],
-                    {"frame": {"duration": 100, "redraw": False},
-                     "mode": "immediate",
-                     "transition": {"duration": 0}}
-                ],
-                "label": str(frameId),
-                "method": "animate"
-            })
+            if not frames:
+                initial_traces = frame_traces
             
             # Create frame
             frames.append(go.Frame(
-                data=frame_traces + field_surfaces,
+                data=frame_traces,
+                traces=dynamic_traces,
                 name=str(frameId)
             ))
         
+        # Add the fully styled player and football traces at their first positions
+        fig.add_traces([{**style, **trace} for style, trace in zip(trace_styles, initial_traces)])
+        
         # Update layout with metrics
         title_text = (
             f"GameId: {gameId}, PlayId: {playId}<br>"
@@ -268,13 +300,24 @@ class NFLPlayAnimator:
         return fig
 
 
-    def create_animation_controls(self):
+    def create_hover_text(self, player_data: pd.DataFrame) -> pd.Series:
+        """Build the hover text for every player row in one vectorized pass"""
+        # Name and jersey are fixed for the whole play, so format them once per player
+        players = player_data.drop_duplicates('nflId').set_index('nflId')
+        prefix = "Name: " + players['displayName'] + "<br>Jersey: " + players['jerseyNumber'].astype(str)
+        return (
+            player_data['nflId'].map(prefix) +
+            "<br>Speed: " + np.char.mod('%.1f', player_data['s'].values) + " mph" +
+            "<br>Direction: " + np.char.mod('%.1f', player_data['dir'].values) + "°"
+        )
+
+    def create_animation_controls(self, frame_stride: int = 1):
         """Create animation controls for the play visualization"""
         updatemenus_dict = [
             {
                 "buttons": [
                     {
-                        "args": [None, {"frame": {"duration": 100, "redraw": True},
+                        "args": [None, {"frame": {"duration": 100 * frame_stride, "redraw": True},
                                     "fromcurrent": True,
                                     "transition": {"duration": 0}}],
                         "label": "Play",
@@ -319,7 +362,15 @@ class NFLPlayAnimator:
 
         return updatemenus_dict, sliders_dict
     
-    def create_field_surface(self) -> List[go.Mesh3d]:
+    def create_field_surface(self) -> List[Dict]:
+        """Return the field surfaces, building them on first use and caching them as plain dicts"""
+        if NFLPlayAnimator._field_surface_cache is None:
+            NFLPlayAnimator._field_surface_cache = tuple(
+                surface.to_plotly_json() for surface in self._build_field_surface()
+            )
+        return copy.deepcopy(list(NFLPlayAnimator._field_surface_cache))
+
+    def _build_field_surface(self) -> List[go.Mesh3d]:
         """Create the football field surface with endzones and yard lines"""
         surfaces = []
         
@@ -357,42 +408,26 @@ class NFLPlayAnimator:
             )
         )
         
-        # Add yard lines
-        for yard in range(10, 111, 5):
-            x, y, z = self._create_grid(yard-0.1, yard+0.1, 0, 53.3, 0.1)
-            surfaces.append(
-                go.Mesh3d(
-                    x=x, y=y, z=z,
-                    color='white',
-                    showscale=False,
-                    hoverinfo='none'
-                )
-            )
-        
-        # Add hash marks
-        # Lower hash marks
-        for yard in range(10, 111):
-            x, y, z = self._create_grid(yard-0.1, yard+0.1, 22.5, 23.5, 0.1)
-            surfaces.append(
-                go.Mesh3d(
-                    x=x, y=y, z=z,
-                    color='white',
-                    showscale=False,
-                    hoverinfo='none'
-                )
-            )
-        
-        # Upper hash marks
-        for yard in range(10, 111):
-            x, y, z = self._create_grid(yard-0.1, yard+0.1, 28.75, 29.75, 0.1)
-            surfaces.append(
-                go.Mesh3d(
-                    x=x, y=y, z=z,
-                    color='white',
-                    showscale=False,
-                    hoverinfo='none'
-                )
+        # Add yard lines and hash marks (lower, then upper) as a single white mesh
+        yard_lines = np.arange(10, 111, 5, dtype=np.float32)
+        hash_marks = np.arange(10, 111, dtype=np.float32)
+        yards = np.concatenate([yard_lines, hash_marks, hash_marks])
+        counts = [yard_lines.size, hash_marks.size, hash_marks.size]
+        x, y, z, i, j, k = self._create_quads(
+            yards - 0.1, yards + 0.1,
+            np.repeat([0, 22.5, 28.75], counts),
+            np.repeat([53.3, 23.5, 29.75], counts),
+            0.1
+        )
+        surfaces.append(
+            go.Mesh3d(
+                x=x, y=y, z=z,
+                i=i, j=j, k=k,
+                color='white',
+                showscale=False,
+                hoverinfo='none'
             )
+        )
         
         return surfaces
 
@@ -402,4 +437,19 @@ class NFLPlayAnimator:
         y = np.array([y_min, y_max, y_max, y_min])
         z = np.full_like(x, z_val)
         
-        return x, y, z
\ No newline at end of file
+        return x, y, z
+
+    def _create_quads(self, x_min: np.ndarray, x_max: np.ndarray, y_min: np.ndarray, y_max: np.ndarray, z_val: float) -> Tuple[np.ndarray, ...]:
+        """Helper function to build one vertex and triangle buffer for a batch of rectangles"""
+        # Same corner order as _create_grid, four vertices per rectangle
+        x = np.stack([x_min, x_min, x_max, x_max], axis=1).ravel()
+        y = np.stack([y_min, y_max, y_max, y_min], axis=1).ravel()
+        z = np.full_like(x, z_val)
+        
+        # Two triangles per rectangle: (0, 1, 2) and (0, 2, 3)
+        corner = np.arange(len(x_min)) * 4
+        i = np.concatenate([corner, corner])
+        j = np.concatenate([corner + 1, corner + 2])
+        k = np.concatenate([corner + 2, corner + 3])
+        
+        return x, y, z, i, j, k